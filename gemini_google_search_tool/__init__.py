@@ -20,18 +20,39 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-# Public API exports for library usage
-from gemini_google_search_tool.core.client import GeminiClient, GeminiClientError
-from gemini_google_search_tool.core.search import (
-    Citation,
-    GroundingSegment,
-    SearchError,
-    SearchResponse,
-    add_inline_citations,
-    query_with_grounding,
-)
+# Program name used in usage, version and completion output
+PROG_NAME = "gemini-google-search-tool"
+
+if TYPE_CHECKING:
+    from gemini_google_search_tool.core.client import GeminiClient, GeminiClientError
+    from gemini_google_search_tool.core.search import (
+        Citation,
+        GroundingSegment,
+        SearchError,
+        SearchResponse,
+        add_inline_citations,
+        aquery_with_grounding,
+        query_with_grounding,
+    )
+
+# Public API exports for library usage, resolved lazily on first attribute
+# access (PEP 562) so that CLI invocations like --help do not import them
+_LAZY: dict[str, tuple[str, str]] = {
+    "GeminiClient": ("gemini_google_search_tool.core.client", "GeminiClient"),
+    "GeminiClientError": ("gemini_google_search_tool.core.client", "GeminiClientError"),
+    "SearchError": ("gemini_google_search_tool.core.search", "SearchError"),
+    "SearchResponse": ("gemini_google_search_tool.core.search", "SearchResponse"),
+    "Citation": ("gemini_google_search_tool.core.search", "Citation"),
+    "GroundingSegment": ("gemini_google_search_tool.core.search", "GroundingSegment"),
+    "query_with_grounding": ("gemini_google_search_tool.core.search", "query_with_grounding"),
+    "aquery_with_grounding": ("gemini_google_search_tool.core.search", "aquery_with_grounding"),
+    "add_inline_citations": ("gemini_google_search_tool.core.search", "add_inline_citations"),
+}
 
 __all__ = [
     "__version__",
@@ -42,5 +63,31 @@ __all__ = [
     "Citation",
     "GroundingSegment",
     "query_with_grounding",
+    "aquery_with_grounding",
     "add_inline_citations",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import public API members on first access.
+
+    Args:
+        name: Attribute name being looked up on the package
+
+    Returns:
+        The requested public API member
+
+    Raises:
+        AttributeError: If the name is not part of the public API
+    """
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily exported names."""
+    return sorted(set(globals()) | set(__all__))
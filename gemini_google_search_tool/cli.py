@@ -1,17 +1,130 @@
 """CLI entry point for gemini-google-search-tool.
 
+Defines the top-level Click group. Subcommands implemented in the
+commands package are registered lazily, so their modules are only
+imported when the command is actually resolved.
+
 Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import functools
+import importlib
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
 import click
-from click.shell_completion import BashComplete, FishComplete, ZshComplete
 
-from gemini_google_search_tool.commands import query
+from gemini_google_search_tool import PROG_NAME, __version__
+
+if TYPE_CHECKING:
+    from click.shell_completion import ShellComplete
+
+
+@functools.cache
+def _completion_classes() -> Mapping[str, type[ShellComplete]]:
+    """Build the read-only shell name to completion class mapping once.
+
+    The click.shell_completion import is deferred until a completion
+    script is actually requested.
+
+    Returns:
+        Mapping of supported shell names to their completion classes
+    """
+    from click.shell_completion import BashComplete, FishComplete, ZshComplete
+
+    return MappingProxyType(
+        {
+            "bash": BashComplete,
+            "zsh": ZshComplete,
+            "fish": FishComplete,
+        }
+    )
+
+
+def _completion_cache_path(shell: str) -> Path:
+    """Get the cache file for a rendered completion script.
+
+    The package and Click versions are part of the file name, so upgrading
+    either the tool or Click (which renders the script template)
+    invalidates previously cached scripts.
+
+    Args:
+        shell: The shell type (bash, zsh, fish)
+
+    Returns:
+        Path under $XDG_CACHE_HOME (default: ~/.cache)
+    """
+    # Deferred import: importlib.metadata is only needed for completion scripts
+    from importlib.metadata import version
 
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    file_name = f"completion-{shell}-{__version__}-click{version('click')}.sh"
+    return Path(cache_home) / PROG_NAME / file_name
 
-@click.group()
-@click.version_option(version="0.1.0")
+
+def _write_completion_cache(cache_path: Path, source: str) -> None:
+    """Store a rendered completion script, ignoring unwritable cache locations.
+
+    Args:
+        cache_path: Destination cache file
+        source: Completion script source
+    """
+    # Write to a temporary file first so concurrent shells never read a partial script
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(source)
+        tmp_path.replace(cache_path)
+    except OSError:
+        # Do not leave a partially written script behind
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules on first use.
+
+    A lazy command NAME is loaded from
+    gemini_google_search_tool.commands.NAME_commands, which must define a
+    Click command object called NAME.
+
+    Attributes:
+        lazy_commands: Names of the lazily registered subcommands
+    """
+
+    def __init__(self, *args: Any, lazy_commands: list[str] | None = None, **kwargs: Any) -> None:
+        """Initialize the group.
+
+        Args:
+            *args: Positional arguments forwarded to click.Group
+            lazy_commands: Names of subcommands to resolve on demand
+            **kwargs: Keyword arguments forwarded to click.Group
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or []
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eagerly and lazily registered subcommand names."""
+        return sorted([*super().list_commands(ctx), *self.lazy_commands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve a subcommand, importing its module if it is lazy."""
+        if cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+
+        module = importlib.import_module(f"gemini_google_search_tool.commands.{cmd_name}_commands")
+        command: click.Command = getattr(module, cmd_name)
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_commands=["query"])
+@click.version_option(version=__version__, prog_name=PROG_NAME)
 def main() -> None:
     """A CLI that enables you to query Gemini with Google Search grounding.
 
@@ -41,10 +154,6 @@ def main() -> None:
     pass
 
 
-# Register commands
-main.add_command(query)
-
-
 @main.command()
 @click.argument("shell", type=click.Choice(["bash", "zsh", "fish"]))
 def completion(shell: str) -> None:
@@ -86,28 +195,34 @@ def completion(shell: str) -> None:
         mkdir -p ~/.config/fish/completions
         gemini-google-search-tool completion fish > \\
             ~/.config/fish/completions/gemini-google-search-tool.fish
+
+    The generated script is cached in $XDG_CACHE_HOME/gemini-google-search-tool
+    (default: ~/.cache) and regenerated when the tool or Click version changes.
     """
-    ctx = click.get_current_context()
-    prog_name = ctx.find_root().info_name or "gemini-google-search-tool"
-
-    # Get the appropriate completion class
-    completion_classes = {
-        "bash": BashComplete,
-        "zsh": ZshComplete,
-        "fish": FishComplete,
-    }
-
-    completion_class = completion_classes.get(shell)
-    if completion_class:
-        completer = completion_class(
-            cli=ctx.find_root().command,
-            ctx_args={},
-            prog_name=prog_name,
-            complete_var=f"_{prog_name.upper().replace('-', '_')}_COMPLETE",
-        )
-        click.echo(completer.source())
-    else:
-        raise click.BadParameter(f"Unsupported shell: {shell}")
+    root = click.get_current_context().find_root()
+    prog_name = root.info_name or PROG_NAME
+
+    # Scripts embed the program name, so only the standard name is cached
+    cache_path = _completion_cache_path(shell) if prog_name == PROG_NAME else None
+    if cache_path is not None:
+        try:
+            click.echo(cache_path.read_text())
+            return
+        except OSError:
+            pass
+
+    # SHELL is already validated by click.Choice
+    completion_class = _completion_classes()[shell]
+    completer = completion_class(
+        cli=root.command,
+        ctx_args={},
+        prog_name=prog_name,
+        complete_var=f"_{prog_name.upper().replace('-', '_')}_COMPLETE",
+    )
+    source = completer.source()
+    if cache_path is not None:
+        _write_completion_cache(cache_path, source)
+    click.echo(source)
 
 
 if __name__ == "__main__":
@@ -1,30 +1,192 @@
 """Query command implementation for gemini-google-search-tool.
 
-This module implements the CLI 'query' command.
+This module implements the CLI 'query' command, including the concurrent
+batch modes that read prompts from stdin (--stdin-batch) or from a JSONL
+file (--jsonl).
 
 Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import asyncio
+import operator
 import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
 
 import click
 
 from gemini_google_search_tool.core.client import GeminiClient, GeminiClientError
 from gemini_google_search_tool.core.search import (
     SearchError,
+    SearchResponse,
     add_inline_citations,
+    aquery_with_grounding,
     query_with_grounding,
 )
 from gemini_google_search_tool.logging_config import get_logger, setup_logging
 from gemini_google_search_tool.utils import (
     output_json,
+    output_jsonl,
     output_text,
+    read_jsonl_prompts,
+    read_stdin_prompts,
     validate_prompt,
 )
 
 logger = get_logger(__name__)
 
+# Default number of in-flight requests in --stdin-batch and --jsonl modes
+BATCH_MAX_CONCURRENCY = 8
+
+# Fetches the GroundingSegment fields serialized under grounding_supports
+_segment_fields = operator.attrgetter("start_index", "end_index", "text", "chunk_indices")
+
+
+def _apply_inline_citations(response: SearchResponse) -> None:
+    """Insert inline citation links into the response text in place.
+
+    Args:
+        response: SearchResponse whose response_text is updated
+    """
+    if not response.grounding_segments:
+        return
+
+    logger.debug("Adding inline citations to response text")
+    response.response_text = add_inline_citations(
+        response.response_text,
+        response.grounding_segments,
+        response.citations,
+    )
+    logger.info("Citations added to response text")
+
+
+def _build_output(response: SearchResponse, verbose: int) -> dict[str, object]:
+    """Build the JSON output structure for a search response.
+
+    Args:
+        response: SearchResponse to serialize
+        verbose: Verbosity count; grounding metadata is included at 2 or higher
+
+    Returns:
+        Dictionary ready for JSON serialization
+    """
+    output: dict[str, object] = {"response_text": response.response_text}
+
+    # Add citations if available
+    if response.citations:
+        logger.debug("Adding %d citations to output", len(response.citations))
+        output["citations"] = response.citations
+
+    # Add debug metadata if requested (-vv or -vvv)
+    if verbose >= 2:
+        logger.debug("Adding grounding metadata to output")
+        grounding_dict: dict[str, object] = {}
+
+        if response.web_search_queries:
+            logger.debug("Web search queries: %s", response.web_search_queries)
+            grounding_dict["web_search_queries"] = response.web_search_queries
+
+        if response.citations:
+            grounding_dict["grounding_chunks"] = response.citations
+
+        if response.grounding_segments:
+            logger.debug("Grounding segments: %d", len(response.grounding_segments))
+            grounding_dict["grounding_supports"] = [
+                {
+                    "segment": {"start_index": start, "end_index": end, "text": seg_text},
+                    "grounding_chunk_indices": chunk_indices,
+                }
+                for start, end, seg_text, chunk_indices in map(
+                    _segment_fields, response.grounding_segments
+                )
+            ]
+
+        if grounding_dict:
+            output["grounding_metadata"] = grounding_dict
+
+    return output
+
+
+async def _iter_batch(
+    client: GeminiClient,
+    prompts: list[str],
+    model: str,
+    max_concurrency: int,
+) -> AsyncIterator[tuple[int, SearchResponse | SearchError]]:
+    """Run grounded queries for all prompts concurrently.
+
+    Args:
+        client: Initialized GeminiClient instance
+        prompts: Prompts to query
+        model: Model to use
+        max_concurrency: Maximum number of requests in flight at once
+
+    Yields:
+        Tuples of (prompt position, SearchResponse or SearchError) in
+        completion order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(index: int, batch_prompt: str) -> tuple[int, SearchResponse | SearchError]:
+        async with semaphore:
+            try:
+                return index, await aquery_with_grounding(client, batch_prompt, model)
+            except SearchError as e:
+                return index, e
+
+    for next_result in asyncio.as_completed([run_one(i, p) for i, p in enumerate(prompts)]):
+        yield await next_result
+
+
+async def _run_batch(
+    client: GeminiClient,
+    prompts: list[str],
+    model: str,
+    max_concurrency: int,
+) -> list[SearchResponse | SearchError]:
+    """Run grounded queries for all prompts concurrently and collect the results.
+
+    Args:
+        client: Initialized GeminiClient instance
+        prompts: Prompts to query
+        model: Model to use
+        max_concurrency: Maximum number of requests in flight at once
+
+    Returns:
+        One SearchResponse or SearchError per prompt, in input order
+    """
+    results: dict[int, SearchResponse | SearchError] = {}
+    async for index, result in _iter_batch(client, prompts, model, max_concurrency):
+        results[index] = result
+    return [results[i] for i in range(len(prompts))]
+
+
+def _build_batch_item(
+    batch_prompt: str,
+    result: SearchResponse | SearchError,
+    add_citations: bool,
+    verbose: int,
+) -> dict[str, object]:
+    """Build the output object for one prompt of a batch.
+
+    Args:
+        batch_prompt: The prompt that was queried
+        result: SearchResponse, or the SearchError raised for this prompt
+        add_citations: Whether to add inline citations to the response text
+        verbose: Verbosity count, forwarded to the output builder
+
+    Returns:
+        Dictionary with the prompt and either the output fields or an error
+    """
+    if isinstance(result, SearchError):
+        logger.error("Query failed for prompt '%s': %s", batch_prompt[:50], result)
+        return {"prompt": batch_prompt, "error": str(result)}
+
+    if add_citations:
+        _apply_inline_citations(result)
+    return {"prompt": batch_prompt, **_build_output(result, verbose)}
+
 
 @click.command()
 @click.argument("prompt", required=False)
@@ -35,6 +197,28 @@ logger = get_logger(__name__)
     default=False,
     help="Read prompt from stdin (overrides PROMPT argument)",
 )
+@click.option(
+    "--stdin-batch",
+    is_flag=True,
+    default=False,
+    help="Read one prompt per line from stdin (16 MiB total) and query them concurrently",
+)
+@click.option(
+    "--jsonl",
+    "jsonl_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help='Query each {"prompt": ...} line of a JSONL file concurrently, streaming JSONL output',
+)
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help=(
+        "Maximum concurrent requests for --stdin-batch and --jsonl "
+        f"(default: {BATCH_MAX_CONCURRENCY})"
+    ),
+)
 @click.option(
     "--add-citations",
     is_flag=True,
@@ -63,6 +247,9 @@ logger = get_logger(__name__)
 def query(
     prompt: str | None,
     stdin: bool,
+    stdin_batch: bool,
+    jsonl_path: Path | None,
+    max_concurrency: int | None,
     add_citations: bool,
     pro: bool,
     text: bool,
@@ -85,6 +272,15 @@ def query(
         # Read prompt from stdin
         echo "Who won euro 2024?" | gemini-google-search-tool query --stdin
 
+    \b
+        # Query many prompts concurrently (one per line)
+        cat questions.txt | gemini-google-search-tool query --stdin-batch
+
+    \b
+        # Query a JSONL file of {"prompt": ...} objects, 16 at a time
+        gemini-google-search-tool query --jsonl questions.jsonl \\
+            --max-concurrency 16
+
     \b
         # Use pro model with markdown output
         gemini-google-search-tool query "Latest AI developments" \\
@@ -110,6 +306,11 @@ def query(
           "citations": [{"index": 1, "uri": "...", "title": "..."}],
           "grounding_metadata": {...}  // Only with -vv or -vvv
         }
+        With --stdin-batch, returns a JSON array with one such object
+        per prompt, each with an added "prompt" key (or "error" on failure).
+        With --jsonl, writes one such object per line as results complete,
+        each with added "index" (0-based position among the non-blank
+        prompts) and "prompt" keys (or "error" on failure).
 
     \b
     Output Format (--text):
@@ -126,17 +327,39 @@ def query(
     logger.info("Starting query command")
 
     try:
+        # Select model
+        model = "gemini-2.5-pro" if pro else "gemini-2.5-flash"
+
+        if stdin_batch and jsonl_path:
+            raise ValueError("--stdin-batch cannot be combined with --jsonl")
+
+        if max_concurrency is not None and not (stdin_batch or jsonl_path):
+            raise ValueError("--max-concurrency requires --stdin-batch or --jsonl")
+        batch_concurrency = BATCH_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
+
+        if stdin_batch:
+            if prompt or stdin or text:
+                raise ValueError("--stdin-batch cannot be combined with PROMPT, --stdin or --text")
+            if not _query_batch(model, add_citations, verbose, batch_concurrency):
+                sys.exit(1)
+            return
+
+        if jsonl_path:
+            if prompt or stdin or text:
+                raise ValueError("--jsonl cannot be combined with PROMPT, --stdin or --text")
+            if not _query_jsonl(jsonl_path, model, add_citations, verbose, batch_concurrency):
+                sys.exit(1)
+            return
+
         # Validate and retrieve prompt
         final_prompt = validate_prompt(prompt, stdin)
-        logger.debug(f"Validated prompt: {final_prompt[:50]}...")
+        logger.debug("Validated prompt: %s...", final_prompt[:50])
 
         # Initialize client
         logger.debug("Initializing Gemini client")
         client = GeminiClient()
 
-        # Select model
-        model = "gemini-2.5-pro" if pro else "gemini-2.5-flash"
-        logger.info(f"Querying with model '{model}' and Google Search grounding")
+        logger.info("Querying with model '%s' and Google Search grounding", model)
 
         # Execute query
         logger.debug("Executing query with grounding")
@@ -147,89 +370,115 @@ def query(
         )
 
         logger.info("Query completed successfully")
-        logger.debug(f"Response length: {len(response.response_text)} characters")
-        logger.debug(f"Citations found: {len(response.citations)}")
+        logger.debug("Response length: %d characters", len(response.response_text))
+        logger.debug("Citations found: %d", len(response.citations))
+
+        # Add inline citations if requested (applies to both output formats)
+        if add_citations:
+            _apply_inline_citations(response)
 
         # Handle text output
         if text:
             logger.debug("Formatting output as markdown text")
-            # Add inline citations if requested
-            if add_citations and response.grounding_segments:
-                logger.debug("Adding inline citations to response text")
-                response.response_text = add_inline_citations(
-                    response.response_text,
-                    response.grounding_segments,
-                    response.citations,
-                )
-                logger.info("Citations added to response text")
-
             output_text(response)
             return
 
         # Handle JSON output (default)
         logger.debug("Formatting output as JSON")
-        output: dict[str, object] = {}
-
-        # Add inline citations if requested
-        if add_citations and response.grounding_segments:
-            logger.debug("Adding inline citations to response text")
-            response.response_text = add_inline_citations(
-                response.response_text,
-                response.grounding_segments,
-                response.citations,
-            )
-            logger.info("Citations added to response text")
-
-        output["response_text"] = response.response_text
-
-        # Add citations if available
-        if response.citations:
-            logger.debug(f"Adding {len(response.citations)} citations to output")
-            output["citations"] = [
-                {"index": c.index, "uri": c.uri, "title": c.title} for c in response.citations
-            ]
-
-        # Add debug metadata if requested (-vv or -vvv)
-        if verbose >= 2:
-            logger.debug("Adding grounding metadata to output")
-            grounding_dict: dict[str, object] = {}
-
-            if response.web_search_queries:
-                logger.debug(f"Web search queries: {response.web_search_queries}")
-                grounding_dict["web_search_queries"] = response.web_search_queries
-
-            if response.citations:
-                grounding_dict["grounding_chunks"] = [
-                    {"index": c.index, "uri": c.uri, "title": c.title} for c in response.citations
-                ]
-
-            if response.grounding_segments:
-                logger.debug(f"Grounding segments: {len(response.grounding_segments)}")
-                grounding_dict["grounding_supports"] = [
-                    {
-                        "segment": {
-                            "start_index": seg.start_index,
-                            "end_index": seg.end_index,
-                            "text": seg.text,
-                        },
-                        "grounding_chunk_indices": seg.chunk_indices,
-                    }
-                    for seg in response.grounding_segments
-                ]
-
-            if grounding_dict:
-                output["grounding_metadata"] = grounding_dict
-
-        output_json(output)
+        output_json(_build_output(response, verbose))
 
     except (GeminiClientError, SearchError, ValueError) as e:
-        logger.error(f"Query failed: {str(e)}")
+        logger.error("Query failed: %s", e)
         logger.debug("Full traceback:", exc_info=True)
-        click.echo(f"Error: {str(e)}", err=True)
+        sys.stderr.write(f"Error: {e}\n")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Unexpected error: {type(e).__name__}")
-        logger.error(f"Error message: {str(e)}")
+        logger.error("Unexpected error: %s", type(e).__name__)
+        logger.error("Error message: %s", e)
         logger.debug("Full traceback:", exc_info=True)
-        click.echo(f"Error: Unexpected error: {str(e)}", err=True)
+        sys.stderr.write(f"Error: Unexpected error: {e}\n")
         sys.exit(1)
+
+
+def _query_batch(model: str, add_citations: bool, verbose: int, max_concurrency: int) -> bool:
+    """Query every prompt read from stdin concurrently and output a JSON array.
+
+    Args:
+        model: Model to use
+        add_citations: Whether to add inline citations to each response text
+        verbose: Verbosity count, forwarded to the output builder
+        max_concurrency: Maximum number of requests in flight at once
+
+    Returns:
+        True if all prompts succeeded, False if any prompt failed
+
+    Raises:
+        GeminiClientError: If the client cannot be initialized
+        ValueError: If stdin is empty or cannot be read
+    """
+    prompts = read_stdin_prompts()
+    logger.debug("Read %d prompts from stdin", len(prompts))
+
+    logger.debug("Initializing Gemini client")
+    client = GeminiClient()
+
+    logger.info(
+        "Querying %d prompts with model '%s' and Google Search grounding", len(prompts), model
+    )
+    results = asyncio.run(_run_batch(client, prompts, model, max_concurrency))
+
+    batch_output = [
+        _build_batch_item(batch_prompt, result, add_citations, verbose)
+        for batch_prompt, result in zip(prompts, results, strict=True)
+    ]
+
+    logger.info("Batch completed: %d prompts", len(prompts))
+    output_json(batch_output)
+    return not any(isinstance(result, SearchError) for result in results)
+
+
+def _query_jsonl(
+    path: Path, model: str, add_citations: bool, verbose: int, max_concurrency: int
+) -> bool:
+    """Query every prompt of a JSONL file concurrently and stream JSONL results.
+
+    Each result is written as soon as it completes, so output lines are in
+    completion order; the "index" field gives the prompt's 0-based
+    position among the file's non-blank lines (blank lines are skipped
+    and not counted).
+
+    Args:
+        path: JSONL file with one {"prompt": ...} object per line
+        model: Model to use
+        add_citations: Whether to add inline citations to each response text
+        verbose: Verbosity count, forwarded to the output builder
+        max_concurrency: Maximum number of requests in flight at once
+
+    Returns:
+        True if all prompts succeeded, False if any prompt failed
+
+    Raises:
+        GeminiClientError: If the client cannot be initialized
+        ValueError: If the file contains invalid lines
+    """
+    prompts = read_jsonl_prompts(path)
+    logger.debug("Read %d prompts from %s", len(prompts), path)
+
+    logger.debug("Initializing Gemini client")
+    client = GeminiClient()
+
+    logger.info(
+        "Querying %d prompts with model '%s' and Google Search grounding", len(prompts), model
+    )
+
+    async def stream() -> bool:
+        succeeded = True
+        async for index, result in _iter_batch(client, prompts, model, max_concurrency):
+            succeeded = succeeded and not isinstance(result, SearchError)
+            item = _build_batch_item(prompts[index], result, add_citations, verbose)
+            output_jsonl({"index": index, **item})
+        return succeeded
+
+    succeeded = asyncio.run(stream())
+    logger.info("Batch completed: %d prompts", len(prompts))
+    return succeeded
@@ -6,16 +6,56 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
-from gemini_google_search_tool.core.client import GeminiClient
-from gemini_google_search_tool.core.search import (
-    SearchResponse,
-    add_inline_citations,
-    query_with_grounding,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from gemini_google_search_tool.core.client import GeminiClient
+    from gemini_google_search_tool.core.search import (
+        SearchResponse,
+        add_inline_citations,
+        aquery_with_grounding,
+        query_with_grounding,
+    )
+
+# Resolved lazily on first attribute access (PEP 562), see the package __init__
+_LAZY: dict[str, tuple[str, str]] = {
+    "GeminiClient": ("gemini_google_search_tool.core.client", "GeminiClient"),
+    "SearchResponse": ("gemini_google_search_tool.core.search", "SearchResponse"),
+    "query_with_grounding": ("gemini_google_search_tool.core.search", "query_with_grounding"),
+    "aquery_with_grounding": ("gemini_google_search_tool.core.search", "aquery_with_grounding"),
+    "add_inline_citations": ("gemini_google_search_tool.core.search", "add_inline_citations"),
+}
 
 __all__ = [
     "GeminiClient",
     "SearchResponse",
     "query_with_grounding",
+    "aquery_with_grounding",
     "add_inline_citations",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import core members on first access.
+
+    Args:
+        name: Attribute name being looked up on the module
+
+    Returns:
+        The requested core member
+
+    Raises:
+        AttributeError: If the name is not exported by this module
+    """
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily exported names."""
+    return sorted(set(globals()) | set(__all__))
@@ -6,10 +6,14 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import asyncio
+import functools
 import logging
 import os
+from typing import TYPE_CHECKING
 
-from google import genai
+if TYPE_CHECKING:
+    from google import genai
 
 logger = logging.getLogger(__name__)
 
@@ -20,14 +24,44 @@ class GeminiClientError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def _get_client(api_key: str, loop: asyncio.AbstractEventLoop | None) -> genai.Client:
+    """Create the underlying genai.Client, reusing it for repeated keys.
+
+    Caching the instance lets every GeminiClient built with the same API key
+    share one HTTP transport, so repeated queries reuse open connections.
+    The SDK's async transport is bound to the event loop it first runs on,
+    so the running loop is part of the cache key: each asyncio.run() gets a
+    fresh client instead of connections left over from a closed loop.
+
+    Args:
+        api_key: Gemini API key
+        loop: Running event loop, or None outside of async code
+
+    Returns:
+        The shared genai.Client instance for this API key and event loop
+    """
+    # Deferred import: loading the SDK is only needed once a client is built
+    from google import genai
+
+    logger.debug("Creating genai.Client instance")
+    return genai.Client(api_key=api_key)
+
+
 class GeminiClient:
     """Manages Gemini API client instance.
 
     This class handles client initialization, API key validation,
     and provides a singleton-like interface for the Gemini client.
 
+    Instances are not independent: all GeminiClients with the same API key
+    share one genai.Client (and its connection pool) per event loop. Sync
+    calls share the client created outside any loop; calls made inside a
+    running loop, such as aquery_with_grounding(), share one created for
+    that loop.
+
     Attributes:
-        _client: The underlying genai.Client instance
+        _api_key: The validated Gemini API key
 
     Raises:
         GeminiClientError: If GEMINI_API_KEY environment variable is not set
@@ -57,15 +91,18 @@ class GeminiClient:
                 "Set it with: export GEMINI_API_KEY='your-api-key'"
             )
 
-        logger.debug("Creating genai.Client instance")
-        self._client = genai.Client(api_key=api_key)
+        self._api_key = api_key
         logger.info("GeminiClient initialized successfully")
 
     @property
     def client(self) -> genai.Client:
-        """Get the underlying Gemini client.
+        """Get the underlying Gemini client for the current event loop.
 
         Returns:
-            The genai.Client instance
+            The genai.Client instance shared for this API key and loop
         """
-        return self._client
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        return _get_client(self._api_key, loop)
@@ -7,13 +7,17 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import functools
 import logging
+import operator
 from dataclasses import dataclass
-
-from google.genai import types
+from typing import TYPE_CHECKING
 
 from gemini_google_search_tool.core.client import GeminiClient
 
+if TYPE_CHECKING:
+    from google.genai import types
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,7 +27,7 @@ class SearchError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Citation:
     """Represents a single citation source.
 
@@ -38,7 +42,7 @@ class Citation:
     title: str
 
 
-@dataclass
+@dataclass(slots=True)
 class GroundingSegment:
     """Represents a text segment with grounding support.
 
@@ -55,7 +59,7 @@ class GroundingSegment:
     chunk_indices: list[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResponse:
     """Represents a complete search response with grounding metadata.
 
@@ -72,6 +76,147 @@ class SearchResponse:
     grounding_segments: list[GroundingSegment] | None = None
 
 
+@functools.cache
+def _grounding_config() -> types.GenerateContentConfig:
+    """Build the generation config that enables Google Search grounding.
+
+    The config is built once and shared by all queries; the SDK only
+    reads it when serializing the request.
+
+    Returns:
+        GenerateContentConfig with the Google Search tool attached
+    """
+    # Deferred import: keeps the SDK off the import path of the package
+    from google.genai import types
+
+    logger.debug("Building Google Search grounding tool")
+    grounding_tool = types.Tool(google_search=types.GoogleSearch())
+    return types.GenerateContentConfig(tools=[grounding_tool])
+
+
+def _extract_citations(grounding_metadata: types.GroundingMetadata) -> list[Citation]:
+    """Extract citation sources from grounding chunks.
+
+    Args:
+        grounding_metadata: Grounding metadata of the first candidate
+
+    Returns:
+        Citations for every chunk with a URI, numbered by chunk position
+    """
+    citations: list[Citation] = []
+    append_citation = citations.append
+    try:
+        for i, chunk in enumerate(grounding_metadata.grounding_chunks or []):
+            web = getattr(chunk, "web", None)
+            if web is not None:
+                uri = web.uri
+                title = web.title
+            else:
+                # Legacy flat chunk schema
+                uri = getattr(chunk, "uri", None)
+                title = getattr(chunk, "title", None)
+
+            if uri:
+                append_citation(Citation(index=i + 1, uri=uri, title=title or ""))
+    except AttributeError:
+        logger.debug("Unexpected grounding chunk schema, keeping partial citations", exc_info=True)
+
+    logger.debug("Extracted %d citations", len(citations))
+    return citations
+
+
+def _extract_web_search_queries(grounding_metadata: types.GroundingMetadata) -> list[str] | None:
+    """Extract the web search queries Gemini executed.
+
+    Args:
+        grounding_metadata: Grounding metadata of the first candidate
+
+    Returns:
+        List of search queries, or None if there are none
+    """
+    try:
+        queries = grounding_metadata.web_search_queries
+    except AttributeError:
+        logger.debug("Unexpected web search queries schema, skipping", exc_info=True)
+        return None
+
+    if not queries:
+        return None
+    logger.debug("Web search queries: %s", queries)
+    return queries
+
+
+def _extract_grounding_segments(
+    grounding_metadata: types.GroundingMetadata,
+) -> list[GroundingSegment] | None:
+    """Extract text segments and the chunks that support them.
+
+    Args:
+        grounding_metadata: Grounding metadata of the first candidate
+
+    Returns:
+        List of grounding segments, or None if there are none
+    """
+    segments: list[GroundingSegment] = []
+    append_segment = segments.append
+    try:
+        for support in grounding_metadata.grounding_supports or []:
+            segment = support.segment
+            if segment:
+                append_segment(
+                    GroundingSegment(
+                        start_index=segment.start_index or 0,
+                        end_index=segment.end_index or 0,
+                        text=segment.text or "",
+                        chunk_indices=support.grounding_chunk_indices or [],
+                    )
+                )
+    except AttributeError:
+        logger.debug("Unexpected grounding support schema, keeping partial segments", exc_info=True)
+
+    if not segments:
+        return None
+    logger.debug("Extracted %d grounding segments", len(segments))
+    return segments
+
+
+def _parse_response(response: types.GenerateContentResponse) -> SearchResponse:
+    """Extract response text and grounding metadata from a Gemini response.
+
+    Args:
+        response: Raw response returned by generate_content
+
+    Returns:
+        SearchResponse containing response text and grounding metadata
+    """
+    # Extract response text
+    response_text = ""
+    if response.candidates and len(response.candidates) > 0:
+        candidate = response.candidates[0]
+        if candidate.content and candidate.content.parts:
+            # A list lets str.join size the result up front, unlike a generator
+            response_text = "".join(
+                [part.text for part in candidate.content.parts if part.text is not None]
+            )
+
+    logger.debug("Extracted response text: %d characters", len(response_text))
+
+    # Extract grounding metadata. SDK response models always define these
+    # fields (None when absent), so they are read directly; each field is
+    # extracted separately so that one unexpected schema keeps the others.
+    logger.debug("Extracting grounding metadata")
+    grounding_metadata = response.candidates[0].grounding_metadata if response.candidates else None
+    if not grounding_metadata:
+        return SearchResponse(response_text=response_text, citations=[])
+
+    return SearchResponse(
+        response_text=response_text,
+        citations=_extract_citations(grounding_metadata),
+        web_search_queries=_extract_web_search_queries(grounding_metadata),
+        grounding_segments=_extract_grounding_segments(grounding_metadata),
+    )
+
+
 def query_with_grounding(
     client: GeminiClient,
     prompt: str,
@@ -90,17 +235,14 @@ def query_with_grounding(
     Raises:
         SearchError: If the query fails or returns invalid response
     """
-    logger.debug(f"Starting query with grounding: model={model}")
-    logger.debug(f"Prompt length: {len(prompt)} characters")
+    logger.debug("Starting query with grounding: model=%s", model)
+    logger.debug("Prompt length: %d characters", len(prompt))
 
     try:
-        # Build Google Search tool
-        logger.debug("Building Google Search grounding tool")
-        grounding_tool = types.Tool(google_search=types.GoogleSearch())
-        config = types.GenerateContentConfig(tools=[grounding_tool])
+        config = _grounding_config()
 
         # Generate content
-        logger.debug(f"Calling Gemini API: model={model}")
+        logger.debug("Calling Gemini API: model=%s", model)
         response = client.client.models.generate_content(
             model=model,
             contents=prompt,
@@ -108,90 +250,62 @@ def query_with_grounding(
         )
 
         logger.debug("API call completed successfully")
+        search_response = _parse_response(response)
 
-        # Extract response text
-        response_text = ""
-        if response.candidates and len(response.candidates) > 0:
-            candidate = response.candidates[0]
-            if candidate.content and candidate.content.parts:
-                response_text = "".join(
-                    part.text
-                    for part in candidate.content.parts
-                    if hasattr(part, "text") and part.text is not None
-                )
+        logger.info("Query with grounding completed successfully")
+        return search_response
 
-        logger.debug(f"Extracted response text: {len(response_text)} characters")
-
-        # Extract grounding metadata
-        logger.debug("Extracting grounding metadata")
-        citations: list[Citation] = []
-        web_search_queries: list[str] | None = None
-        grounding_segments: list[GroundingSegment] | None = None
-
-        if (
-            response.candidates
-            and len(response.candidates) > 0
-            and hasattr(response.candidates[0], "grounding_metadata")
-        ):
-            grounding_metadata = response.candidates[0].grounding_metadata
-
-            if grounding_metadata:
-                # Extract citations
-                chunks = getattr(grounding_metadata, "grounding_chunks", [])
-                for i, chunk in enumerate(chunks):
-                    uri = None
-                    title = None
-
-                    if hasattr(chunk, "web") and chunk.web:
-                        uri = getattr(chunk.web, "uri", None)
-                        title = getattr(chunk.web, "title", None)
-                    elif hasattr(chunk, "uri"):
-                        uri = chunk.uri
-                        title = getattr(chunk, "title", None)
-
-                    if uri:
-                        citations.append(Citation(index=i + 1, uri=uri, title=title or ""))
-
-                logger.debug(f"Extracted {len(citations)} citations")
-
-                # Extract web search queries
-                queries = getattr(grounding_metadata, "web_search_queries", [])
-                if queries:
-                    web_search_queries = queries
-                    logger.debug(f"Web search queries: {queries}")
-
-                # Extract grounding supports
-                supports = getattr(grounding_metadata, "grounding_supports", [])
-                if supports:
-                    segments: list[GroundingSegment] = []
-                    for support in supports:
-                        segment = getattr(support, "segment", None)
-                        chunk_indices = getattr(support, "grounding_chunk_indices", [])
-
-                        if segment:
-                            segments.append(
-                                GroundingSegment(
-                                    start_index=getattr(segment, "start_index", 0),
-                                    end_index=getattr(segment, "end_index", 0),
-                                    text=getattr(segment, "text", ""),
-                                    chunk_indices=chunk_indices,
-                                )
-                            )
-                    if segments:
-                        grounding_segments = segments
-                        logger.debug(f"Extracted {len(segments)} grounding segments")
+    except Exception as e:
+        logger.error("Query with grounding failed: %s", type(e).__name__)
+        logger.error("Error message: %s", e)
+        logger.debug("Full traceback:", exc_info=True)
+        raise SearchError(f"Query failed: {str(e)}") from e
 
-        logger.info("Query with grounding completed successfully")
-        return SearchResponse(
-            response_text=response_text,
-            citations=citations,
-            web_search_queries=web_search_queries,
-            grounding_segments=grounding_segments,
+
+async def aquery_with_grounding(
+    client: GeminiClient,
+    prompt: str,
+    model: str = "gemini-2.5-flash",
+) -> SearchResponse:
+    """Query Gemini with Google Search grounding using the async API.
+
+    Behaves like query_with_grounding() but awaits the request on the
+    client's aio interface, so many prompts can be in flight at once.
+
+    Args:
+        client: Initialized GeminiClient instance
+        prompt: The query prompt
+        model: Model to use (default: gemini-2.5-flash)
+
+    Returns:
+        SearchResponse containing response text and grounding metadata
+
+    Raises:
+        SearchError: If the query fails or returns invalid response
+    """
+    logger.debug("Starting async query with grounding: model=%s", model)
+    logger.debug("Prompt length: %d characters", len(prompt))
+
+    try:
+        config = _grounding_config()
+
+        # Generate content
+        logger.debug("Calling Gemini async API: model=%s", model)
+        response = await client.client.aio.models.generate_content(
+            model=model,
+            contents=prompt,
+            config=config,
         )
 
+        logger.debug("Async API call completed successfully")
+        search_response = _parse_response(response)
+
+        logger.info("Async query with grounding completed successfully")
+        return search_response
+
     except Exception as e:
-        logger.error(f"Query with grounding failed: {type(e).__name__}")
-        logger.error(f"Error message: {str(e)}")
+        logger.error("Async query with grounding failed: %s", type(e).__name__)
+        logger.error("Error message: %s", e)
         logger.debug("Full traceback:", exc_info=True)
         raise SearchError(f"Query failed: {str(e)}") from e
 
@@ -220,31 +334,47 @@ def add_inline_citations(
         logger.debug("No grounding segments or citations available, returning unchanged text")
         return response_text
 
-    logger.debug(f"Processing {len(grounding_segments)} grounding segments")
+    # Skip building the link table and sorting when no segment cites anything
+    if not any(segment.chunk_indices for segment in grounding_segments):
+        logger.debug("No grounding segment references a citation, returning unchanged text")
+        return response_text
 
-    # Create citation URI lookup
-    citation_uris = {c.index: c.uri for c in citations}
+    logger.debug("Processing %d grounding segments", len(grounding_segments))
 
-    # Sort segments by end_index in descending order to avoid shifting issues
-    sorted_segments = sorted(grounding_segments, key=lambda s: s.end_index, reverse=True)
+    # Format each citation link once, in a list indexed by 0-based chunk index
+    # (chunk_indices are 0-based, citation index is 1-based and dense)
+    link_by_chunk: list[str | None] = [None] * max(c.index for c in citations)
+    for c in citations:
+        if c.uri and c.index > 0:
+            link_by_chunk[c.index - 1] = f"[{c.index}]({c.uri})"
+    chunk_count = len(link_by_chunk)
 
-    text = response_text
-    for segment in sorted_segments:
+    # Collect (position, citation string) insertions in ascending position order.
+    # Supports usually arrive in text order, so Timsort finds a single run.
+    inserts: list[tuple[int, str]] = []
+    for segment in sorted(grounding_segments, key=operator.attrgetter("end_index")):
         if not segment.chunk_indices:
             continue
 
         # Create citation string like [1](link1), [2](link2)
-        citation_links = []
-        for chunk_idx in segment.chunk_indices:
-            # chunk_indices are 0-based, citation index is 1-based
-            citation_idx = chunk_idx + 1
-            uri = citation_uris.get(citation_idx)
-            if uri:
-                citation_links.append(f"[{citation_idx}]({uri})")
-
+        citation_links = [
+            link
+            for chunk_idx in segment.chunk_indices
+            if 0 <= chunk_idx < chunk_count and (link := link_by_chunk[chunk_idx])
+        ]
         if citation_links:
-            citation_string = ", ".join(citation_links)
-            text = text[: segment.end_index] + citation_string + text[segment.end_index :]
+            inserts.append((segment.end_index, ", ".join(citation_links)))
+
+    # Walk the original text once, interleaving slices and citation strings
+    parts: list[str] = []
+    append_part = parts.append
+    cursor = 0
+    for position, citation_string in inserts:
+        append_part(response_text[cursor:position])
+        append_part(citation_string)
+        cursor = position
+    append_part(response_text[cursor:])
+    text = "".join(parts)
 
     logger.debug("Inline citations added successfully")
     return text
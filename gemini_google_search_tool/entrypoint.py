@@ -0,0 +1,38 @@
+"""Console script entry point for gemini-google-search-tool.
+
+The common 'query' invocation is dispatched straight to the query command
+without building the top-level Click group, and a bare --version is
+answered before Click is imported at all. The group in cli.py is only
+loaded for everything else (--help, completion).
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import sys
+
+from gemini_google_search_tool import PROG_NAME, __version__
+
+
+def main() -> None:
+    """Run the CLI, short-circuiting --version and dispatching 'query' directly."""
+    args = sys.argv[1:]
+
+    if args == ["--version"]:
+        # Same output as click.version_option on the cli group
+        sys.stdout.write(f"{PROG_NAME}, version {__version__}\n")
+        return
+
+    if args and args[0] == "query":
+        from gemini_google_search_tool.commands.query_commands import query
+
+        query.main(args=args[1:], prog_name=f"{PROG_NAME} query")
+        return
+
+    from gemini_google_search_tool.cli import main as cli
+
+    cli()
+
+
+if __name__ == "__main__":
+    main()
@@ -19,26 +19,26 @@ def setup_logging(verbose_count: int = 0) -> None:
 
     Args:
         verbose_count: Number of -v flags (0-3+)
-            0: WARNING level (quiet mode)
+            0: Quiet mode; logging is left unconfigured, so only WARNING
+               and above reach stderr via Python's default handler
             1: INFO level (normal verbose)
             2: DEBUG level (detailed debugging)
             3+: DEBUG + enable dependent library logging (trace mode)
 
     Example:
-        >>> setup_logging(0)  # No -v flag: WARNING only
+        >>> setup_logging(0)  # No -v flag: warnings and errors only
         >>> setup_logging(1)  # -v: INFO level
         >>> setup_logging(2)  # -vv: DEBUG level
         >>> setup_logging(3)  # -vvv: DEBUG + library internals
     """
+    # Quiet mode: skip handler setup entirely. The root logger keeps its
+    # level (WARNING by default), so our INFO/DEBUG calls return after a
+    # single level check while warnings from any library remain visible.
+    if verbose_count <= 0:
+        return
+
     # Map verbosity count to logging levels
-    if verbose_count == 0:
-        level = logging.WARNING
-    elif verbose_count == 1:
-        level = logging.INFO
-    elif verbose_count >= 2:
-        level = logging.DEBUG
-    else:
-        level = logging.WARNING
+    level = logging.INFO if verbose_count == 1 else logging.DEBUG
 
     # Configure root logger
     logging.basicConfig(
@@ -7,14 +7,18 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
-import json
 import sys
+from pathlib import Path
 from typing import Any
 
-import click
-
 from gemini_google_search_tool.core.search import SearchResponse
 
+# Maximum size of a single prompt accepted from stdin (1 MiB)
+MAX_STDIN_BYTES = 1024 * 1024
+
+# Maximum size of the whole --stdin-batch input accepted from stdin (16 MiB)
+MAX_STDIN_BATCH_BYTES = 16 * 1024 * 1024
+
 
 def print_verbose(message: str, verbose: bool | int = False) -> None:
     """Print verbose message to stderr.
@@ -26,16 +30,39 @@ def print_verbose(message: str, verbose: bool | int = False) -> None:
         verbose: Whether to print the message (bool or int count)
     """
     if verbose:
-        click.echo(f"[INFO] {message}", err=True)
+        sys.stderr.write(f"[INFO] {message}\n")
 
 
 def output_json(data: Any) -> None:
     """Output JSON to stdout.
 
+    Serializes with orjson, which also encodes dataclasses such as
+    Citation natively, and writes the UTF-8 bytes in a single call.
+
+    Args:
+        data: Data to serialize as JSON (dict or list)
+    """
+    # Deferred import: --text output never needs the JSON encoder
+    import orjson
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(
+        orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    )
+    sys.stdout.buffer.flush()
+
+
+def output_jsonl(data: Any) -> None:
+    """Output a single compact JSON line to stdout and flush it.
+
     Args:
         data: Data to serialize as JSON (dict or list)
     """
-    click.echo(json.dumps(data, indent=2))
+    import orjson
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
 
 
 def output_text(response: SearchResponse) -> None:
@@ -46,44 +73,130 @@ def output_text(response: SearchResponse) -> None:
     Args:
         response: SearchResponse containing response text and citations
     """
-    # Output response text (may already contain markdown from Gemini)
-    click.echo(response.response_text)
+    # Response text (may already contain markdown from Gemini)
+    lines = [response.response_text]
 
-    # Output citations in markdown format if available
+    # Citations in markdown format, e.g. 1. [Title](https://url), falling
+    # back to the URI as the label when the source has no title
     if response.citations:
-        click.echo("\n## Citations\n")
-        for citation in response.citations:
-            if citation.title:
-                # Format: 1. [Title](https://url)
-                click.echo(f"{citation.index}. [{citation.title}]({citation.uri})")
-            else:
-                # Format: 1. [https://url](https://url)
-                click.echo(f"{citation.index}. [{citation.uri}]({citation.uri})")
+        lines.append("\n## Citations\n")
+        lines.extend(f"{c.index}. [{c.title or c.uri}]({c.uri})" for c in response.citations)
 
+    sys.stdout.write("\n".join(lines) + "\n")
 
-def read_stdin() -> str:
-    """Read input from stdin.
+
+def _read_stdin_bytes(max_bytes: int, too_large_hint: str, usage: str) -> bytes:
+    """Read all of stdin as raw bytes in one call.
+
+    Surrounding ASCII whitespace is stripped from the bytes, so no
+    unstripped str copy is ever built.
+
+    Args:
+        max_bytes: Maximum accepted input size in bytes
+        too_large_hint: Advice appended to the error for oversized input
+        usage: Example command line shown when no input is piped
 
     Returns:
-        Content from stdin as a string
+        Stripped, non-empty stdin content as bytes
 
     Raises:
-        ValueError: If stdin is empty or cannot be read
+        ValueError: If stdin is a terminal, empty, or larger than max_bytes
     """
     if sys.stdin.isatty():
-        raise ValueError(
-            "No input available from stdin. "
-            "Use --stdin flag with piped input: echo 'question' | tool query --stdin"
-        )
+        raise ValueError(f"No input available from stdin. Pipe input to the tool: {usage}")
 
-    content = sys.stdin.read().strip()
-    if not content:
+    # Read one byte past the limit to detect oversized input without reading it all
+    data = sys.stdin.buffer.read(max_bytes + 1)
+    if len(data) > max_bytes:
         raise ValueError(
-            "Empty input received from stdin. "
-            "Provide non-empty input: echo 'question' | tool query --stdin"
+            f"Input from stdin exceeds the maximum of {max_bytes} bytes. {too_large_hint}"
         )
 
-    return content
+    data = data.strip()
+    if not data:
+        raise ValueError(f"Empty input received from stdin. Provide non-empty input: {usage}")
+
+    return data
+
+
+def read_stdin() -> str:
+    """Read a single prompt from stdin.
+
+    Returns:
+        Content from stdin as a string
+
+    Raises:
+        ValueError: If stdin is empty, larger than MAX_STDIN_BYTES, or cannot be read
+    """
+    data = _read_stdin_bytes(
+        MAX_STDIN_BYTES,
+        "Provide a shorter prompt.",
+        "echo 'question' | tool query --stdin",
+    )
+    return data.decode("utf-8", errors="replace")
+
+
+def read_stdin_prompts() -> list[str]:
+    """Read one prompt per line from stdin.
+
+    The whole input is limited to MAX_STDIN_BATCH_BYTES. Blank lines
+    are skipped.
+
+    Returns:
+        List of non-empty prompts in input order
+
+    Raises:
+        ValueError: If stdin is empty, larger than MAX_STDIN_BATCH_BYTES,
+            or cannot be read
+    """
+    data = _read_stdin_bytes(
+        MAX_STDIN_BATCH_BYTES,
+        "Split the prompts into smaller batches.",
+        "cat questions.txt | tool query --stdin-batch",
+    )
+    lines = [line.strip() for line in data.decode("utf-8", errors="replace").splitlines()]
+    return [line for line in lines if line]
+
+
+def read_jsonl_prompts(path: Path) -> list[str]:
+    """Read prompts from a JSONL file.
+
+    Each non-blank line must be a JSON object with a non-empty string
+    "prompt" field.
+
+    Args:
+        path: Path to the JSONL file
+
+    Returns:
+        List of prompts in file order
+
+    Raises:
+        ValueError: If a line is not valid JSON or has no usable prompt,
+            or if the file contains no prompts
+    """
+    import orjson
+
+    prompts: list[str] = []
+    with path.open("rb") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON: {e}") from e
+
+            prompt = record.get("prompt") if isinstance(record, dict) else None
+            if not isinstance(prompt, str) or not prompt.strip():
+                raise ValueError(
+                    f"{path}:{line_number}: expected an object with a non-empty 'prompt' string"
+                )
+            prompts.append(prompt.strip())
+
+    if not prompts:
+        raise ValueError(f"No prompts found in {path}")
+
+    return prompts
 
 
 def validate_prompt(prompt: str | None, use_stdin: bool) -> str:
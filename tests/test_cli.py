@@ -0,0 +1,62 @@
+"""Tests for gemini_google_search_tool.cli module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from gemini_google_search_tool import PROG_NAME
+from gemini_google_search_tool.cli import _completion_cache_path, main
+
+
+@pytest.fixture
+def cache_home(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Point $XDG_CACHE_HOME at a temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
+def test_completion_caches_rendered_script(cache_home: Path) -> None:
+    """Test that the first call writes the cache and the second call reads it."""
+    runner = CliRunner()
+    cache_path = _completion_cache_path("bash")
+    assert cache_path.is_relative_to(cache_home)
+
+    first = runner.invoke(main, ["completion", "bash"], prog_name=PROG_NAME)
+    assert first.exit_code == 0, first.output
+    assert "_GEMINI_GOOGLE_SEARCH_TOOL_COMPLETE" in first.output
+    assert cache_path.read_text() + "\n" == first.output
+
+    cache_path.write_text("# cached script")
+    second = runner.invoke(main, ["completion", "bash"], prog_name=PROG_NAME)
+    assert second.exit_code == 0, second.output
+    assert second.output == "# cached script\n"
+
+
+def test_completion_with_other_prog_name_is_not_cached(cache_home: Path) -> None:
+    """Test that scripts rendered for another program name bypass the cache."""
+    result = CliRunner().invoke(main, ["completion", "zsh"], prog_name="ggst")
+
+    assert result.exit_code == 0, result.output
+    assert "_GGST_COMPLETE" in result.output
+    assert list(cache_home.iterdir()) == []
+
+
+def test_completion_cache_write_failure_leaves_no_temp_file(
+    cache_home: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed cache write still outputs the script and cleans up."""
+
+    def fail_replace(self: Path, target: Path) -> Path:
+        raise OSError("read-only cache")
+
+    monkeypatch.setattr(Path, "replace", fail_replace)
+    result = CliRunner().invoke(main, ["completion", "fish"], prog_name=PROG_NAME)
+
+    assert result.exit_code == 0, result.output
+    assert "_GEMINI_GOOGLE_SEARCH_TOOL_COMPLETE" in result.output
+    assert list(_completion_cache_path("fish").parent.iterdir()) == []
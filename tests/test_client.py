@@ -0,0 +1,50 @@
+"""Tests for gemini_google_search_tool.core.client module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import asyncio
+from collections.abc import Iterator
+
+import pytest
+from google import genai
+
+from gemini_google_search_tool.core.client import GeminiClient, GeminiClientError, _get_client
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache() -> Iterator[None]:
+    """Start and end every test with an empty genai.Client cache."""
+    _get_client.cache_clear()
+    yield
+    _get_client.cache_clear()
+
+
+def test_missing_api_key_raises_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that GeminiClient requires GEMINI_API_KEY."""
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    with pytest.raises(GeminiClientError, match="GEMINI_API_KEY"):
+        GeminiClient()
+
+
+def test_sync_clients_share_one_genai_client() -> None:
+    """Test that GeminiClients with the same key share the sync genai.Client."""
+    first, second = GeminiClient(api_key="test-key"), GeminiClient(api_key="test-key")
+    assert isinstance(first.client, genai.Client)
+    assert first.client is second.client
+
+
+def test_consecutive_event_loops_get_fresh_genai_clients() -> None:
+    """Test that two asyncio.run() calls in a row never share an async transport."""
+    first, second = GeminiClient(api_key="test-key"), GeminiClient(api_key="test-key")
+
+    async def clients_in_loop() -> genai.Client:
+        assert first.client is second.client
+        return first.client
+
+    first_loop_client = asyncio.run(clients_in_loop())
+    second_loop_client = asyncio.run(clients_in_loop())
+
+    assert first_loop_client is not second_loop_client
+    assert first.client is not first_loop_client
@@ -0,0 +1,91 @@
+"""Tests for gemini_google_search_tool.entrypoint module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import json
+import subprocess  # nosec B404
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from gemini_google_search_tool import PROG_NAME, __version__, cli, entrypoint
+
+# Runs the console script in a fresh interpreter and reports on stderr
+# which of the heavier dependencies it imported
+_IMPORT_PROBE = """
+import json, sys
+from gemini_google_search_tool import entrypoint
+sys.argv = ["gemini-google-search-tool", *sys.argv[1:]]
+try:
+    entrypoint.main()
+except SystemExit:
+    pass
+sys.stderr.write(json.dumps({name: name in sys.modules for name in ("click", "google.genai")}))
+"""
+
+
+def _run_entrypoint(args: list[str]) -> tuple[str, dict[str, bool]]:
+    """Run the console script in a subprocess.
+
+    Args:
+        args: Command line arguments after the program name
+
+    Returns:
+        Tuple of (stdout, mapping of module name to whether it was imported)
+    """
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", _IMPORT_PROBE, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout, json.loads(result.stderr.splitlines()[-1])
+
+
+def test_query_is_dispatched_directly(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test that 'query' runs the query command under the full program name."""
+    monkeypatch.setattr(sys, "argv", ["gemini-google-search-tool", "query", "--help"])
+    monkeypatch.setattr(cli, "main", lambda: pytest.fail("cli group should not run"))
+
+    with pytest.raises(SystemExit) as exc_info:
+        entrypoint.main()
+
+    assert exc_info.value.code == 0
+    assert "Usage: gemini-google-search-tool query" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("args", [[], ["--help"], ["completion", "bash"], ["--version", "-v"]])
+def test_other_arguments_fall_through_to_cli_group(
+    monkeypatch: pytest.MonkeyPatch, args: list[str]
+) -> None:
+    """Test that anything but 'query' and a bare --version runs the cli group."""
+    calls: list[list[str]] = []
+    monkeypatch.setattr(sys, "argv", ["gemini-google-search-tool", *args])
+    monkeypatch.setattr(cli, "main", lambda: calls.append(sys.argv[1:]))
+
+    entrypoint.main()
+
+    assert calls == [args]
+
+
+@pytest.mark.parametrize("args", [["--help"], ["completion", "bash"]])
+def test_help_and_completion_do_not_import_genai(args: list[str]) -> None:
+    """Test that startup paths without a query never load the Gemini SDK."""
+    stdout, imported = _run_entrypoint(args)
+
+    assert stdout
+    assert not imported["google.genai"]
+
+
+def test_version_matches_click_without_importing_click() -> None:
+    """Test that the --version fast path prints the click.version_option output."""
+    stdout, imported = _run_entrypoint(["--version"])
+
+    assert stdout == CliRunner().invoke(cli.main, ["--version"], prog_name=PROG_NAME).output
+    assert stdout == f"{PROG_NAME}, version {__version__}\n"
+    assert not imported["click"]
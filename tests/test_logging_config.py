@@ -0,0 +1,24 @@
+"""Tests for gemini_google_search_tool.logging_config module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import logging
+
+import pytest
+
+from gemini_google_search_tool.logging_config import setup_logging
+
+
+def test_quiet_mode_keeps_library_warnings(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that setup_logging(0) leaves the root logger level untouched."""
+    root = logging.getLogger()
+    level_before = root.level
+
+    setup_logging(0)
+
+    assert root.level == level_before
+    logging.getLogger("httpx").warning("connection reset")
+    logging.getLogger("gemini_google_search_tool").info("not shown")
+    assert [record.getMessage() for record in caplog.records] == ["connection reset"]
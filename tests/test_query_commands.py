@@ -0,0 +1,161 @@
+"""Tests for gemini_google_search_tool.commands.query_commands module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+from google.genai import types
+
+from gemini_google_search_tool.commands.query_commands import query
+from gemini_google_search_tool.core import client as client_module
+
+
+class FakeAsyncModels:
+    """Stand-in for genai.Client.aio.models that answers with the prompt.
+
+    The first prompt is held back until the last one has completed, so
+    results always finish out of input order. The prompt "fail" raises.
+    """
+
+    def __init__(self, prompts: list[str]) -> None:
+        self.first = prompts[0]
+        self.last = prompts[-1]
+        self.last_done = asyncio.Event()
+        self.completed: list[str] = []
+
+    async def generate_content(
+        self, model: str, contents: str, config: Any
+    ) -> types.GenerateContentResponse:
+        try:
+            if contents == self.first:
+                await self.last_done.wait()
+            else:
+                await asyncio.sleep(0)
+            if contents == "fail":
+                raise RuntimeError("backend unavailable")
+            return types.GenerateContentResponse(
+                candidates=[
+                    types.Candidate(
+                        content=types.Content(parts=[types.Part(text=f"answer: {contents}")])
+                    )
+                ]
+            )
+        finally:
+            self.completed.append(contents)
+            if contents == self.last:
+                self.last_done.set()
+
+
+@pytest.fixture
+def fake_models(monkeypatch: pytest.MonkeyPatch) -> Any:
+    """Install a fake genai client; call the result with the prompts to expect."""
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+
+    def install(prompts: list[str]) -> FakeAsyncModels:
+        models = FakeAsyncModels(prompts)
+        fake_client = SimpleNamespace(aio=SimpleNamespace(models=models))
+        monkeypatch.setattr(client_module, "_get_client", lambda api_key, loop: fake_client)
+        return models
+
+    return install
+
+
+def test_stdin_batch_returns_results_in_input_order(fake_models: Any) -> None:
+    """Test that --stdin-batch outputs results in input order, not completion order."""
+    prompts = ["first", "second", "third"]
+    models = fake_models(prompts)
+
+    result = CliRunner().invoke(query, ["--stdin-batch"], input="first\n\nsecond\nthird\n")
+
+    assert result.exit_code == 0, result.output
+    assert models.completed[0] != "first"
+    assert json.loads(result.output) == [
+        {"prompt": prompt, "response_text": f"answer: {prompt}"} for prompt in prompts
+    ]
+
+
+def test_stdin_batch_reports_failed_prompt(fake_models: Any) -> None:
+    """Test that a failing prompt yields an error item and exit code 1."""
+    fake_models(["ok", "fail"])
+
+    result = CliRunner().invoke(query, ["--stdin-batch"], input="ok\nfail\n")
+
+    assert result.exit_code == 1
+    assert json.loads(result.output) == [
+        {"prompt": "ok", "response_text": "answer: ok"},
+        {"prompt": "fail", "error": "Query failed: backend unavailable"},
+    ]
+
+
+def test_jsonl_streams_one_line_per_prompt(fake_models: Any, tmp_path: Path) -> None:
+    """Test that --jsonl writes one line per prompt with its input index."""
+    prompts = ["first", "second", "fail"]
+    fake_models(prompts)
+    path = tmp_path / "prompts.jsonl"
+    path.write_text("".join(json.dumps({"prompt": prompt}) + "\n" for prompt in prompts))
+
+    result = CliRunner().invoke(query, ["--jsonl", str(path)])
+
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert len(lines) == len(prompts)
+    assert lines[-1]["index"] == 0
+    by_index = {line.pop("index"): line for line in lines}
+    assert by_index == {
+        0: {"prompt": "first", "response_text": "answer: first"},
+        1: {"prompt": "second", "response_text": "answer: second"},
+        2: {"prompt": "fail", "error": "Query failed: backend unavailable"},
+    }
+
+
+def test_jsonl_index_skips_blank_lines(fake_models: Any, tmp_path: Path) -> None:
+    """Test that --jsonl indexes count non-blank prompts, not file lines."""
+    fake_models(["first", "second"])
+    path = tmp_path / "prompts.jsonl"
+    path.write_text('\n{"prompt": "first"}\n\n  \n{"prompt": "second"}\n')
+
+    result = CliRunner().invoke(query, ["--jsonl", str(path)])
+
+    assert result.exit_code == 0, result.output
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert sorted((line["index"], line["prompt"]) for line in lines) == [
+        (0, "first"),
+        (1, "second"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (["--stdin-batch", "--jsonl", "{jsonl}"], "--stdin-batch cannot be combined with --jsonl"),
+        (["--stdin-batch", "question"], "--stdin-batch cannot be combined with PROMPT"),
+        (["--stdin-batch", "--stdin"], "--stdin-batch cannot be combined with PROMPT"),
+        (["--stdin-batch", "--text"], "--stdin-batch cannot be combined with PROMPT"),
+        (["--jsonl", "{jsonl}", "question"], "--jsonl cannot be combined with PROMPT"),
+        (["--jsonl", "{jsonl}", "--stdin"], "--jsonl cannot be combined with PROMPT"),
+        (["--jsonl", "{jsonl}", "--text"], "--jsonl cannot be combined with PROMPT"),
+        (["question", "--max-concurrency", "4"], "--max-concurrency requires --stdin-batch"),
+        (["--stdin", "--max-concurrency", "4"], "--max-concurrency requires --stdin-batch"),
+    ],
+)
+def test_batch_modes_reject_conflicting_options(
+    fake_models: Any, tmp_path: Path, args: list[str], message: str
+) -> None:
+    """Test that batch modes reject other input and output modes."""
+    models = fake_models(["unused"])
+    path = tmp_path / "prompts.jsonl"
+    path.write_text('{"prompt": "unused"}\n')
+
+    result = CliRunner().invoke(query, [arg.format(jsonl=path) for arg in args], input="q\n")
+
+    assert result.exit_code == 1
+    assert f"Error: {message}" in result.output
+    assert models.completed == []
@@ -0,0 +1,140 @@
+"""Tests for gemini_google_search_tool.core.search module.
+
+Note: This code was generated with assistance from AI coding tools
+and has been reviewed and tested by a human.
+"""
+
+from types import SimpleNamespace
+from typing import Any, cast
+
+from google.genai import types
+
+from gemini_google_search_tool.core.client import GeminiClient
+from gemini_google_search_tool.core.search import (
+    Citation,
+    GroundingSegment,
+    add_inline_citations,
+    query_with_grounding,
+)
+
+CITATIONS = [
+    Citation(index=1, uri="https://one.example", title="One"),
+    Citation(index=2, uri="https://two.example", title="Two"),
+]
+
+
+def test_add_inline_citations_without_segments_returns_text() -> None:
+    """Test that add_inline_citations leaves text unchanged without segments."""
+    assert add_inline_citations("Spain won.", None, CITATIONS) == "Spain won."
+    assert add_inline_citations("Spain won.", [], CITATIONS) == "Spain won."
+
+
+def test_add_inline_citations_inserts_links_at_segment_ends() -> None:
+    """Test that citation links are inserted after each supported segment."""
+    text = "Spain won. Kane scored."
+    segments = [
+        GroundingSegment(start_index=11, end_index=23, text="Kane scored.", chunk_indices=[1]),
+        GroundingSegment(start_index=0, end_index=10, text="Spain won.", chunk_indices=[0, 1]),
+    ]
+    result = add_inline_citations(text, segments, CITATIONS)
+    assert result == (
+        "Spain won.[1](https://one.example), [2](https://two.example)"
+        " Kane scored.[2](https://two.example)"
+    )
+
+
+def test_add_inline_citations_skips_unknown_chunks() -> None:
+    """Test that segments without known citations add nothing."""
+    text = "Spain won."
+    segments = [
+        GroundingSegment(start_index=0, end_index=10, text="Spain won.", chunk_indices=[5]),
+        GroundingSegment(start_index=0, end_index=5, text="Spain", chunk_indices=[]),
+    ]
+    assert add_inline_citations(text, segments, CITATIONS) == text
+
+
+def test_query_with_grounding_extracts_grounding_metadata() -> None:
+    """Test that citations, queries and segments are read from the SDK response."""
+    response = types.GenerateContentResponse(
+        candidates=[
+            types.Candidate(
+                content=types.Content(parts=[types.Part(text="Spain "), types.Part(text="won.")]),
+                grounding_metadata=types.GroundingMetadata(
+                    web_search_queries=["euro 2024 winner"],
+                    grounding_chunks=[
+                        types.GroundingChunk(
+                            web=types.GroundingChunkWeb(uri="https://one.example", title="One")
+                        ),
+                        types.GroundingChunk(
+                            web=types.GroundingChunkWeb(uri="https://two.example")
+                        ),
+                    ],
+                    grounding_supports=[
+                        types.GroundingSupport(
+                            segment=types.Segment(end_index=10, text="Spain won."),
+                            grounding_chunk_indices=[0, 1],
+                        )
+                    ],
+                ),
+            )
+        ]
+    )
+
+    def generate_content(**kwargs: Any) -> types.GenerateContentResponse:
+        return response
+
+    client = SimpleNamespace(
+        client=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    )
+    result = query_with_grounding(cast(GeminiClient, client), "Who won euro 2024?")
+
+    assert result.response_text == "Spain won."
+    assert result.citations == [
+        Citation(index=1, uri="https://one.example", title="One"),
+        Citation(index=2, uri="https://two.example", title=""),
+    ]
+    assert result.web_search_queries == ["euro 2024 winner"]
+    assert result.grounding_segments == [
+        GroundingSegment(start_index=0, end_index=10, text="Spain won.", chunk_indices=[0, 1])
+    ]
+
+
+def test_query_with_grounding_reads_legacy_flat_chunks() -> None:
+    """Test that chunks carrying uri/title directly (no web) still yield citations."""
+    response = SimpleNamespace(
+        candidates=[
+            SimpleNamespace(
+                content=SimpleNamespace(parts=[SimpleNamespace(text="Spain won.")]),
+                grounding_metadata=SimpleNamespace(
+                    web_search_queries=["euro 2024 winner"],
+                    grounding_chunks=[
+                        SimpleNamespace(uri="https://legacy.example", title="Legacy"),
+                        SimpleNamespace(web=SimpleNamespace(uri="https://two.example", title="")),
+                    ],
+                    grounding_supports=[
+                        SimpleNamespace(
+                            segment=SimpleNamespace(start_index=0, end_index=10, text="Spain won."),
+                            grounding_chunk_indices=[0, 1],
+                        )
+                    ],
+                ),
+            )
+        ]
+    )
+
+    def generate_content(**kwargs: Any) -> Any:
+        return response
+
+    client = SimpleNamespace(
+        client=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    )
+    result = query_with_grounding(cast(GeminiClient, client), "Who won euro 2024?")
+
+    assert result.citations == [
+        Citation(index=1, uri="https://legacy.example", title="Legacy"),
+        Citation(index=2, uri="https://two.example", title=""),
+    ]
+    assert result.web_search_queries == ["euro 2024 winner"]
+    assert result.grounding_segments == [
+        GroundingSegment(start_index=0, end_index=10, text="Spain won.", chunk_indices=[0, 1])
+    ]
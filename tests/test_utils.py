@@ -4,9 +4,23 @@ Note: This code was generated with assistance from AI coding tools
 and has been reviewed and tested by a human.
 """
 
+import io
+import json
+import sys
+from pathlib import Path
+
 import pytest
 
-from gemini_google_search_tool.utils import validate_prompt
+from gemini_google_search_tool.core.search import Citation, SearchResponse
+from gemini_google_search_tool.utils import (
+    MAX_STDIN_BATCH_BYTES,
+    MAX_STDIN_BYTES,
+    output_json,
+    output_text,
+    read_jsonl_prompts,
+    read_stdin_prompts,
+    validate_prompt,
+)
 
 
 def test_validate_prompt_with_argument() -> None:
@@ -27,3 +41,78 @@ def test_validate_prompt_empty_string_raises_error() -> None:
     """Test that validate_prompt raises ValueError for empty string."""
     with pytest.raises(ValueError, match="No prompt provided"):
         validate_prompt("", use_stdin=False)
+
+
+def test_output_json_serializes_dataclasses(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that output_json encodes Citation dataclasses as JSON objects."""
+    output_json({"citations": [Citation(index=1, uri="https://example.com", title="Example")]})
+    result = json.loads(capsys.readouterr().out)
+    assert result == {"citations": [{"index": 1, "uri": "https://example.com", "title": "Example"}]}
+
+
+def test_output_text_formats_citations(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that output_text appends a markdown citations list."""
+    response = SearchResponse(
+        response_text="Spain won.",
+        citations=[
+            Citation(index=1, uri="https://a.example", title="A"),
+            Citation(index=2, uri="https://b.example", title=""),
+        ],
+    )
+    output_text(response)
+    assert capsys.readouterr().out == (
+        "Spain won.\n"
+        "\n"
+        "## Citations\n"
+        "\n"
+        "1. [A](https://a.example)\n"
+        "2. [https://b.example](https://b.example)\n"
+    )
+
+
+def test_validate_prompt_from_stdin(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that validate_prompt decodes and strips piped stdin input."""
+    data = "  Qui a gagné l'Euro 2024 ?\n".encode()
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+    assert validate_prompt(None, use_stdin=True) == "Qui a gagné l'Euro 2024 ?"
+
+
+def test_validate_prompt_stdin_too_large_raises_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that validate_prompt rejects stdin input above MAX_STDIN_BYTES."""
+    data = b"x" * (MAX_STDIN_BYTES + 1)
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+    with pytest.raises(ValueError, match="exceeds the maximum"):
+        validate_prompt(None, use_stdin=True)
+
+
+def test_read_stdin_prompts_allows_batches_above_single_prompt_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that --stdin-batch input is capped by MAX_STDIN_BATCH_BYTES only."""
+    line = b"x" * 1023 + b"\n"
+    data = line * (MAX_STDIN_BYTES // len(line) + 1)
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+    assert read_stdin_prompts() == ["x" * 1023] * (MAX_STDIN_BYTES // len(line) + 1)
+
+
+def test_read_stdin_prompts_too_large_raises_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that read_stdin_prompts rejects input above MAX_STDIN_BATCH_BYTES."""
+    data = b"x\n" * (MAX_STDIN_BATCH_BYTES // 2 + 1)
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(data)))
+    with pytest.raises(ValueError, match="smaller batches"):
+        read_stdin_prompts()
+
+
+def test_read_jsonl_prompts(tmp_path: Path) -> None:
+    """Test that read_jsonl_prompts returns prompts in order, skipping blank lines."""
+    path = tmp_path / "prompts.jsonl"
+    path.write_text('{"prompt": "Who won euro 2024?"}\n\n{"prompt": " Latest AI news "}\n')
+    assert read_jsonl_prompts(path) == ["Who won euro 2024?", "Latest AI news"]
+
+
+def test_read_jsonl_prompts_missing_prompt_raises_error(tmp_path: Path) -> None:
+    """Test that read_jsonl_prompts reports the line without a prompt field."""
+    path = tmp_path / "prompts.jsonl"
+    path.write_text('{"prompt": "ok"}\n{"question": "no prompt"}\n')
+    with pytest.raises(ValueError, match=r":2: expected an object"):
+        read_jsonl_prompts(path)